@@ -79,7 +79,8 @@ setup(
             "language_level": "3",
             "boundscheck": False,
             "wraparound": False,
-            "initializedcheck": False
+            "initializedcheck": False,
+            "cdivision": True,  # all divisions in kernels are guarded against zero denominators
         },
     )
 )
@@ -0,0 +1,83 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © 2021 Pi-Yueh Chuang <pychuang@gwu.edu>
+#
+# Distributed under terms of the BSD 3-Clause license.
+
+"""Tests for flux-related kernels.
+"""
+from types import SimpleNamespace
+import numpy
+import pytest
+from torchswe.kernels import get_flux_divergence
+from torchswe.kernels import get_max_local_speed
+
+
+def get_dummy_states(xp, xm, yp, ym):
+    """Get an object with only the local-speed attributes that get_max_local_speed uses."""
+    return SimpleNamespace(face=SimpleNamespace(
+        x=SimpleNamespace(plus=SimpleNamespace(a=xp), minus=SimpleNamespace(a=xm)),
+        y=SimpleNamespace(plus=SimpleNamespace(a=yp), minus=SimpleNamespace(a=ym)),
+    ))
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_max_local_speed(dtype):
+    """Test the maximum local speeds against NumPy."""
+
+    rng = numpy.random.default_rng(0)
+    arrays = [rng.random((5, 6), dtype=dtype) for _ in range(4)]
+    arrays[1] *= -1.  # speeds on the minus side are non-positive
+    arrays[3] *= -1.
+
+    amax, bmax = get_max_local_speed(get_dummy_states(*arrays))
+    assert amax == numpy.maximum(arrays[0], -arrays[1]).max()
+    assert bmax == numpy.maximum(arrays[2], -arrays[3]).max()
+
+    # zero speeds everywhere
+    amax, bmax = get_max_local_speed(get_dummy_states(*[numpy.zeros_like(a) for a in arrays]))
+    assert amax == 0. and bmax == 0.
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_max_local_speed_nan(dtype):
+    """Test that a NaN local speed is propagated to the maximum."""
+
+    arrays = [numpy.ones((5, 6), dtype=dtype) for _ in range(4)]
+    arrays[1] *= -1.
+    arrays[3] *= -1.
+
+    arrays[0][2, 3] = numpy.nan
+    arrays[3][4, 5] = numpy.nan
+    amax, bmax = get_max_local_speed(get_dummy_states(*arrays))
+    assert numpy.isnan(amax) and numpy.isnan(bmax)
+
+    arrays = [numpy.full_like(a, numpy.nan) for a in arrays]
+    amax, bmax = get_max_local_speed(get_dummy_states(*arrays))
+    assert numpy.isnan(amax) and numpy.isnan(bmax)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_flux_divergence(dtype):
+    """Test the divergence of numerical fluxes against NumPy on a non-square grid."""
+
+    ny, nx = 5, 7
+    dy, dx = 0.3, 0.125
+
+    rng = numpy.random.default_rng(0)
+    xcf = rng.random((3, ny, nx+1)).astype(dtype)
+    ycf = rng.random((3, ny+1, nx)).astype(dtype)
+
+    states = SimpleNamespace(
+        s=numpy.full((3, ny, nx), numpy.nan, dtype=dtype),
+        domain=SimpleNamespace(delta=(dy, dx)),
+        face=SimpleNamespace(x=SimpleNamespace(cf=xcf), y=SimpleNamespace(cf=ycf)),
+    )
+
+    ans = (xcf[:, :, :-1] - xcf[:, :, 1:]) / dx + (ycf[:, :-1, :] - ycf[:, 1:, :]) / dy
+
+    states = get_flux_divergence(states)
+    assert states.s.dtype == dtype
+    assert numpy.allclose(states.s, ans, rtol=1e-5 if dtype == "float32" else 1e-12, atol=0.)
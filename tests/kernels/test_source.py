@@ -0,0 +1,37 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © 2021 Pi-Yueh Chuang <pychuang@gwu.edu>
+#
+# Distributed under terms of the BSD 3-Clause license.
+
+"""Tests for source-term kernels.
+"""
+from types import SimpleNamespace
+import numpy
+import pytest
+from torchswe.kernels import add_topography_gradient
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_add_topography_gradient(dtype):
+    """Test topographic forces against NumPy, using depths from a strided non-halo slice."""
+
+    ny, nx, ngh = 5, 7, 2
+    gravity = 9.81
+    nonhalo_c = (slice(ngh, ny+ngh), slice(ngh, nx+ngh))
+
+    rng = numpy.random.default_rng(0)
+    p = rng.random((3, ny+2*ngh, nx+2*ngh)).astype(dtype)
+    s = rng.random((3, ny, nx)).astype(dtype)
+    grad = rng.random((2, ny, nx)).astype(dtype)
+
+    ans = s.copy()
+    ans[1:] -= gravity * p[(0,)+nonhalo_c] * grad
+
+    states = SimpleNamespace(s=s, p=p, domain=SimpleNamespace(nonhalo_c=nonhalo_c))
+    states = add_topography_gradient(states, SimpleNamespace(grad=grad), gravity)
+
+    assert states.s.dtype == dtype
+    assert numpy.array_equal(states.s, ans)
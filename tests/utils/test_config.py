@@ -0,0 +1,95 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © 2021 Pi-Yueh Chuang <pychuang@gwu.edu>
+#
+# Distributed under terms of the BSD 3-Clause license.
+
+"""Tests for configuration models.
+"""
+import json
+import pathlib
+import yaml
+import pytest
+import pydantic
+from torchswe.utils.config import BCConfig
+from torchswe.utils.config import Config
+from torchswe.utils.config import PointSourceConfig
+from torchswe.utils.config import TemporalConfig
+from torchswe.utils.config import _ConfigLoader as Loader
+from torchswe.utils.config import get_config
+
+CASE = pathlib.Path(__file__).resolve().parents[2].joinpath("cases", "lister_1992", "experiment_1")
+
+
+def test_from_trusted():
+    """Test rebuilding a Config from its own dict without validation."""
+
+    config = get_config(CASE)
+
+    for by_alias in [True, False]:
+        rebuilt = Config.from_trusted(config.dict(by_alias=by_alias))
+        assert rebuilt == config
+        assert isinstance(rebuilt.bc.west, type(config.bc.west))
+        assert isinstance(rebuilt.params, type(config.params))
+        rebuilt.check()
+
+
+def test_yaml_roundtrip():
+    """Test dumping a Config to YAML and loading it back."""
+
+    config = get_config(CASE)
+    config.case = CASE
+
+    text = yaml.dump(config)
+    assert "!!python" not in text  # only plain YAML types
+    assert yaml.load(text, Loader) == config
+
+
+def test_bc_periodicity():
+    """Test that periodic BCs have to be paired."""
+
+    periodic = {"types": ["periodic"] * 3}
+    extrap = {"types": ["extrap"] * 3}
+
+    BCConfig(west=periodic, east=periodic, north=extrap, south=extrap)
+    BCConfig(west=extrap, east=extrap, north=periodic, south=periodic)
+
+    for bcs in [
+        dict(west=periodic, east=extrap, north=extrap, south=extrap),
+        dict(west=extrap, east=extrap, north=extrap, south=periodic),
+        dict(west=periodic, east=extrap, north=periodic, south=periodic),
+    ]:
+        with pytest.raises(pydantic.ValidationError):
+            BCConfig(**bcs)
+
+        # tags not produced by pydantic's validation (e.g., from JSON) must be checked as well
+        with pytest.raises(pydantic.ValidationError):
+            BCConfig.from_trusted(json.loads(json.dumps(bcs))).check()
+
+
+def test_output_method():
+    """Test that output methods are validated against the format matching their tags."""
+
+    assert TemporalConfig(output=["at", [1, 2]]).output == ("at", (1., 2.))
+    assert "anyOf" in TemporalConfig.schema()["properties"]["output"]
+
+    with pytest.raises(pydantic.ValidationError) as err:
+        TemporalConfig(output=["t_start t_end n_saves", 0., -1., 3])
+    assert err.value.errors()[0]["loc"] == ("output", 2)
+
+    with pytest.raises(pydantic.ValidationError):
+        TemporalConfig(output=["unknown", 0.])
+
+
+def test_point_source_times():
+    """Test that point-source times have to be strictly increasing."""
+
+    kwargs = {"location": [0., 0.], "rates": [0., 1., 2., 3.]}
+    assert PointSourceConfig(times=[0., 1., 2.], **kwargs).times == (0., 1., 2.)
+    assert PointSourceConfig(times=[], rates=[1.], location=[0., 0.]).times == ()
+
+    for times in [[0., 1., 1.], [0., 2., 1.], [0., float("nan"), 2.]]:
+        with pytest.raises(pydantic.ValidationError, match="is not greater than"):
+            PointSourceConfig(times=times, **kwargs)
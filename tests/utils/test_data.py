@@ -11,6 +11,7 @@
 import pydantic
 from torchswe import nplike
 from torchswe.utils.data import Gridline
+from torchswe.utils.data import Timeline
 
 
 def test_gridline_validation():
@@ -58,3 +59,20 @@ def test_gridline_validation():
     _check_n_errors(1, **_get_data("centers"), centers=nplike.linspace(0., 1., 9))
     _check_n_errors(1, **_get_data("centers"), centers=nplike.linspace(0., 1., 10))
     _check_n_errors(1, **_get_data("xfcenters"), xfcenters=data["yfcenters"])
+
+
+def test_timeline_index():
+    """Test looking up the indices of time values in a Timeline."""
+
+    timeline = Timeline(values=[0., 0.5, 1.5, 3.], save=True)
+
+    for obj in [timeline, Timeline.from_trusted(timeline.dict())]:  # the latter skips __init__
+        assert obj.index(0.) == 0
+        assert obj.index(1.5) == 2
+        assert obj.index(3.) == 3
+
+        try:
+            obj.index(1.)
+            raise AssertionError("Expected exception was not raised.")
+        except ValueError as err:
+            assert "1.0 was not found" in str(err)
@@ -12,6 +12,7 @@
 import os as _os
 import time
 import logging
+import logging.handlers
 import pathlib
 import argparse
 
@@ -77,9 +78,16 @@ def get_cmd_arguments(argv=None):
         help="Indicate this run should continue from this time point."
     )
 
-    parser.add_argument(
-        "--sp", action="store_true", dest="sp",
-        help="Use single precision instead of double precision floating numbers"
+    precision = parser.add_mutually_exclusive_group()
+
+    precision.add_argument(
+        "--sp", action="store_const", const="float32", default=None, dest="dtype",
+        help="Use single precision floating numbers. Default is to respect config.yaml."
+    )
+
+    precision.add_argument(
+        "--dp", action="store_const", const="float64", default=None, dest="dtype",
+        help="Use double precision floating numbers. Default is to respect config.yaml."
     )
 
     parser.add_argument(
@@ -87,6 +95,11 @@ def get_cmd_arguments(argv=None):
         help="Overwrite the time-marching scheme. Default is to respect the setting in config.yaml."
     )
 
+    parser.add_argument(
+        "--no-save", action="store_true", dest="no_save",
+        help="Do not write solutions to files, regardless of the output method in config.yaml."
+    )
+
     parser.add_argument(
         "--log-steps", action="store", type=int, default=None, metavar="STEPS",
         help="How many steps to output a log message to stdout. Default is to respect config.yaml."
@@ -141,7 +154,8 @@ def get_final_config(args: argparse.Namespace):
     # add args to config
     config.case = args.case_folder
 
-    config.params.dtype = "float32" if args.sp else config.params.dtype  # overwrite dtype if needed
+    if args.dtype is not None:  # overwrite dtype if needed
+        config.params.dtype = args.dtype
 
     if args.log_steps is not None:  # overwrite log_steps if needed
         config.params.log_steps = args.log_steps
@@ -167,7 +181,7 @@ def get_final_config(args: argparse.Namespace):
             config.prehook = config.case.joinpath(config.prehook).resolve()
 
     # validate data again
-    config.check()
+    config.check(full=True)
 
     return config
 
@@ -197,8 +211,12 @@ def get_logger(filename, level, mpi_size, mpi_rank):
 
         fmt = "%(asctime)s %(name)s %(funcName)s [%(levelname)s] %(message)s"  # format
         logger.setLevel(level)
-        logger.addHandler(logging.FileHandler(filename, "w"))
-        logger.handlers[-1].setFormatter(logging.Formatter(fmt, "%m-%d %H:%M:%S"))
+
+        # buffer records in memory and write them in bulk; warnings, errors, and closing flush the
+        # buffer, and `main` flushes it at the end of each output interval
+        handler = logging.FileHandler(filename, "w")
+        handler.setFormatter(logging.Formatter(fmt, "%m-%d %H:%M:%S"))
+        logger.addHandler(logging.handlers.MemoryHandler(1024, logging.WARNING, handler, True))
     else:
         if level == logging.INFO:
             if mpi_rank == 0:
@@ -240,7 +258,10 @@ def get_runtime(comm, config, logger):
     # make sure initial depths are non-negative
     states.q[(0,)+states.domain.nonhalo_c] = nplike.maximum(
         runtime.topo.c[states.domain.nonhalo_c], states.q[(0,)+states.domain.nonhalo_c])
-    states.check()
+
+    # get_initial_states already validated states, and the clipping above keeps shapes and dtypes
+    if logger.isEnabledFor(logging.DEBUG):
+        states.check(full=True)
 
     runtime.dt = config.temporal.dt  # time step size; may be changed during runtime
     logger.info("Initial dt: %e", runtime.dt)
@@ -292,6 +313,10 @@ def get_runtime(comm, config, logger):
         logger.info("Friction fucntion added to stiff source terms")
         logger.info("Friction coefficient model: %s", config.friction.model)
 
+    # source terms are fixed from now on; tuples are cheaper to iterate in every RHS evaluation
+    runtime.sources = tuple(runtime.sources)
+    runtime.stiff_sources = tuple(runtime.stiff_sources)
+
     return states, runtime
 
 
@@ -339,6 +364,11 @@ def init(comm, args=None):
     # get states and runtime data holder
     states, runtime = get_runtime(comm, config, logger)
 
+    # disable writing solutions if requested from the command line
+    if args.no_save:
+        runtime.times.save = False
+        logger.info("Solution output disabled through the command line")
+
     return args, config, logger, states, runtime
 
 
@@ -348,15 +378,8 @@ def restart(states, runtime, config, cont, logger):
     if cont is None:  # not restarting
         return states, runtime
 
-    try:
-        runtime.tidx = runtime.times.values.index(cont)
-        logger.info("Restart from output time index and time: %d, %f", runtime.tidx, cont)
-    except ValueError as err:
-        if "not in tuple" not in str(err):  # other kinds of ValueError
-            raise
-        raise ValueError(
-            f"Target restarting time {cont} was not found among {runtime.times.values}"
-        ) from err
+    runtime.tidx = runtime.times.index(cont)  # raises a ValueError if `cont` is not an output time
+    logger.info("Restart from output time index and time: %d, %f", runtime.tidx, cont)
 
     # update current and the next time
     runtime.cur_t = cont
@@ -412,10 +435,31 @@ def main():
         perf_t0 = time.time()
         logger.info("Time marching starts at %s", time.ctime(perf_t0))
 
+    # resolve once whether per-interval messages are emitted (e.g., not with `--log-level quiet`)
+    verbose = logger.isEnabledFor(logging.INFO)
+
+    # resolve once what happens at the end of each output interval
+    if runtime.times.save:
+        def output(soln):
+            soln = write_snapshot(soln, runtime, config)
+            if verbose:
+                logger.info("Done writing the states at T=%s to the solution file.", runtime.next_t)
+            return soln
+    else:
+        def output(soln):
+            return soln
+
+    # the time-marching function never changes during a run; avoid looking it up in every interval
+    marching = runtime.marching
+
+    # handlers of the package-level logger; flushed after each interval so buffered logs reach files
+    log_handlers = tuple(logging.getLogger("torchswe").handlers)
+
     # start running time marching until each output time
     for runtime.next_t in runtime.times[runtime.tidx+1:]:
-        logger.info("Marching from T=%s to T=%s", runtime.cur_t, runtime.next_t)
-        soln = runtime.marching(soln, runtime, config)
+        if verbose:
+            logger.info("Marching from T=%s to T=%s", runtime.cur_t, runtime.next_t)
+        soln = marching(soln, runtime, config)
 
         # sanity check for the current time
         assert abs(runtime.next_t-runtime.cur_t) < 1e-10
@@ -423,10 +467,11 @@ def main():
         # update tidx
         runtime.tidx += 1
 
-        # append to the NetCDF file
-        if runtime.times.save:
-            soln = write_snapshot(soln, runtime, config)
-            logger.info("Done writing the states at T=%s to the solution file.", runtime.next_t)
+        # append to the solution file (a no-op if not saving solutions)
+        soln = output(soln)
+
+        for handler in log_handlers:
+            handler.flush()
 
     if "USE_CUPY" in _os.environ and _os.environ["USE_CUPY"] == "1":
         end_gpu.record()
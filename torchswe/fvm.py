@@ -19,7 +19,9 @@ if _TYPE_CHECKING:  # if we are having type checking, then we import correspondi
 from torchswe import nplike as _nplike
 from torchswe.kernels import get_discontinuous_flux as _get_discontinuous_flux
 from torchswe.kernels import central_scheme as _central_scheme
+from torchswe.kernels import get_flux_divergence as _get_flux_divergence
 from torchswe.kernels import get_local_speed as _get_local_speed
+from torchswe.kernels import get_max_local_speed as _get_max_local_speed
 from torchswe.kernels import reconstruct as _reconstruct
 
 
@@ -57,10 +59,8 @@ def prepare_rhs(states: States, runtime: DummyDict, config: Config):
     # aliases
     dy, dx = states.domain.delta
 
-    # get right-hand-side contributed by spatial derivatives
-    states.s = \
-        (states.face.x.cf[:, :, :-1] - states.face.x.cf[:, :, 1:]) / dx + \
-        (states.face.y.cf[:, :-1, :] - states.face.y.cf[:, 1:, :]) / dy
+    # get right-hand-side contributed by spatial derivatives (overwrites states.s in-place)
+    states = _get_flux_divergence(states)
 
     # add explicit source terms in-place to states.S
     for func in runtime.sources:
@@ -71,10 +71,9 @@ def prepare_rhs(states: States, runtime: DummyDict, config: Config):
         states = func(states, runtime, config)
 
     # obtain the maximum safe dt
-    amax = _nplike.max(_nplike.maximum(states.face.x.plus.a, -states.face.x.minus.a))
-    bmax = _nplike.max(_nplike.maximum(states.face.y.plus.a, -states.face.y.minus.a))
+    amax, bmax = _get_max_local_speed(states)
 
     with _nplike.errstate(divide="ignore"):
-        max_dt = min(dx/amax, dy/bmax)  # may be a `inf` (but never `NaN`)
+        max_dt = _nplike.minimum(dx/amax, dy/bmax)  # `inf` if no flow; `NaN` if diverged
 
     return states, max_dt
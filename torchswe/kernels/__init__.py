@@ -15,14 +15,20 @@ if "LEGATE_MAX_DIM" in _os.environ and "LEGATE_MAX_FIELDS" in _os.environ:
 elif "USE_CUPY" in _os.environ and _os.environ["USE_CUPY"] == "1":
     from .cupy import get_discontinuous_flux
     from .cupy import central_scheme
+    from .cupy import get_flux_divergence
     from .cupy import get_local_speed
+    from .cupy import get_max_local_speed
     from .cupy import reconstruct
     from .cupy import reconstruct_cell_centers
+    from .cupy import add_topography_gradient
 elif "USE_TORCH" in _os.environ and _os.environ["USE_TORCH"] == "1":
     raise NotImplementedError("PyTorch is deprecated.")
 else:
     from .cython import get_discontinuous_flux
     from .cython import central_scheme
+    from .cython import get_flux_divergence
     from .cython import get_local_speed
+    from .cython import get_max_local_speed
     from .cython import reconstruct
     from .cython import reconstruct_cell_centers
+    from .cython import add_topography_gradient
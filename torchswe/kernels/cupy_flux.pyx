@@ -4,24 +4,30 @@ import cupy
 
 
 cdef get_discontinuous_flux_x = cupy.ElementwiseKernel(
-    "T hu, T h, T u, T v, float64 grav2",
-    "T f0, T f1, T f2",
+    "T mhu, T mh, T mu, T mv, T phu, T ph, T pu, T pv, float64 grav2",
+    "T mf0, T mf1, T mf2, T pf0, T pf1, T pf2",
     """
-        f0 = hu;
-        f1 = hu * u + grav2 * h * h;
-        f2 = hu * v;
+        mf0 = mhu;
+        mf1 = mhu * mu + grav2 * mh * mh;
+        mf2 = mhu * mv;
+        pf0 = phu;
+        pf1 = phu * pu + grav2 * ph * ph;
+        pf2 = phu * pv;
     """,
     "get_discontinuous_flux_x"
 )
 
 
 cdef get_discontinuous_flux_y = cupy.ElementwiseKernel(
-    "T hv, T h, T u, T v, float64 grav2",
-    "T f0, T f1, T f2",
+    "T mhv, T mh, T mu, T mv, T phv, T ph, T pu, T pv, float64 grav2",
+    "T mf0, T mf1, T mf2, T pf0, T pf1, T pf2",
     """
-        f0 = hv;
-        f1 = u * hv;
-        f2 = hv * v + grav2 * h * h;
+        mf0 = mhv;
+        mf1 = mu * mhv;
+        mf2 = mhv * mv + grav2 * mh * mh;
+        pf0 = phv;
+        pf1 = pu * phv;
+        pf2 = phv * pv + grav2 * ph * ph;
     """,
     "get_discontinuous_flux_y"
 )
@@ -51,13 +57,17 @@ def get_discontinuous_flux(object states, double gravity):
     ym = y.minus
     yp = y.plus
 
-    # face normal to x-direction: [hu, hu^2 + g(h^2)/2, huv]
-    get_discontinuous_flux_x(xm.q[1], xm.p[0], xm.p[1], xm.p[2], grav2, xm.f[0], xm.f[1], xm.f[2])
-    get_discontinuous_flux_x(xp.q[1], xp.p[0], xp.p[1], xp.p[2], grav2, xp.f[0], xp.f[1], xp.f[2])
+    # face normal to x-direction: [hu, hu^2 + g(h^2)/2, huv]; both sides in one launch
+    get_discontinuous_flux_x(
+        xm.q[1], xm.p[0], xm.p[1], xm.p[2], xp.q[1], xp.p[0], xp.p[1], xp.p[2], grav2,
+        xm.f[0], xm.f[1], xm.f[2], xp.f[0], xp.f[1], xp.f[2]
+    )
 
-    # face normal to y-direction: [hv, huv, hv^2+g(h^2)/2]
-    get_discontinuous_flux_y(ym.q[2], ym.p[0], ym.p[1], ym.p[2], grav2, ym.f[0], ym.f[1], ym.f[2])
-    get_discontinuous_flux_y(yp.q[2], yp.p[0], yp.p[1], yp.p[2], grav2, yp.f[0], yp.f[1], yp.f[2])
+    # face normal to y-direction: [hv, huv, hv^2+g(h^2)/2]; both sides in one launch
+    get_discontinuous_flux_y(
+        ym.q[2], ym.p[0], ym.p[1], ym.p[2], yp.q[2], yp.p[0], yp.p[1], yp.p[2], grav2,
+        ym.f[0], ym.f[1], ym.f[2], yp.f[0], yp.f[1], yp.f[2]
+    )
 
     return states
 
@@ -152,3 +162,69 @@ def get_local_speed(object states, double gravity):
     get_local_speed_kernel(ypU[0], ymU[0], ypU[2], ymU[2], gravity, ypa, yma)
 
     return states
+
+
+# NaN (x != x) is carried through explicitly because max() would silently drop it
+cdef max_local_speed_kernel = cupy.ReductionKernel(
+    "T ap, T am",
+    "T amax",
+    "(ap != ap || am != am) ? ap + am : max(ap, -am)",
+    "(a != a || b != b) ? a + b : max(a, b)",
+    "amax = a",
+    "0",  # ap >= 0 and am <= 0, so zero is a valid identity
+    "max_local_speed_kernel"
+)
+
+
+def get_max_local_speed(object states):
+    """Get the maximum magnitudes of local speeds on faces normal to x and y directions.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+
+    Returns
+    -------
+    amax, bmax : 0-dimension cupy.ndarray
+        The maximum local speeds on faces normal to x and y directions, respectively.
+    """
+
+    cdef object x = states.face.x
+    cdef object y = states.face.y
+
+    return max_local_speed_kernel(x.plus.a, x.minus.a), max_local_speed_kernel(y.plus.a, y.minus.a)
+
+
+cdef flux_divergence_kernel = cupy.ElementwiseKernel(
+    "T xhm, T xhp, T yhm, T yhp, float64 inv_dx, float64 inv_dy",
+    "T s",
+    """
+        s = (xhm - xhp) * inv_dx + (yhm - yhp) * inv_dy;
+    """,
+    "flux_divergence_kernel"
+)
+
+
+def get_flux_divergence(object states):
+    """Calculate the right-hand-side terms contributed by the divergence of numerical fluxes.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. `states.s` is overwritten in-place. Returning it just for
+        coding style.
+    """
+
+    cdef object xH = states.face.x.cf
+    cdef object yH = states.face.y.cf
+    cdef double inv_dy = 1.0 / states.domain.delta[0]
+    cdef double inv_dx = 1.0 / states.domain.delta[1]
+
+    flux_divergence_kernel(
+        xH[:, :, :-1], xH[:, :, 1:], yH[:, :-1, :], yH[:, 1:, :], inv_dx, inv_dy, states.s)
+
+    return states
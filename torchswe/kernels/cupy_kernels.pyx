@@ -6,3 +6,4 @@ import cupy
 cimport cython
 include "cupy_flux.pyx"
 include "cupy_reconstruction.pyx"
+include "cupy_source.pyx"
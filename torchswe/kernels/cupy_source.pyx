@@ -0,0 +1,40 @@
+# vim:fenc=utf-8
+# vim:ft=pyrex
+import cupy
+
+
+cdef topography_gradient_kernel = cupy.ElementwiseKernel(
+    "T h, T gradx, T grady, T gravity",
+    "T s1, T s2",
+    """
+        T gh = gravity * h;
+        s1 -= gh * gradx;
+        s2 -= gh * grady;
+    """,
+    "topography_gradient_kernel"
+)
+
+
+def add_topography_gradient(object states, object topo, double gravity):
+    """Add topographic forces to `states.s[1]` and `states.s[2]` in-place.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+    topo : torchswe.utils.data.Topography
+    gravity : float
+        Gravity in m / s^2.
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. Changed inplace. Returning it just for coding style.
+    """
+
+    cdef object S = states.s
+    cdef object grad = topo.grad
+    cdef object H = states.p[(0,)+states.domain.nonhalo_c]
+
+    topography_gradient_kernel(H, grad[0], grad[1], S.dtype.type(gravity), S[1], S[2])
+
+    return states
@@ -16,20 +16,12 @@ cdef void get_discontinuous_flux_x(
     cdef Py_ssize_t k, j, i
     cdef cython.floating grav2 = gravity / 2.0
 
-    # F[0] = hu
+    # one sweep for all components so that each face's values are loaded only once
     for j in range(ny):
         for i in range(nx):
-            F[0, j, i] = Q[1, j, i]
-
-    # F[1] = hu * u + g/2 * h * h
-    for j in range(ny):
-        for i in range(nx):
-            F[1, j, i] = Q[1, j, i] * U[1, j, i] + grav2 * (U[0, j, i] * U[0, j, i])
-
-    # F[2] = hu * v
-    for j in range(ny):
-        for i in range(nx):
-            F[2, j, i] = Q[1, j, i] * U[2, j, i]
+            F[0, j, i] = Q[1, j, i]  # hu
+            F[1, j, i] = Q[1, j, i] * U[1, j, i] + grav2 * (U[0, j, i] * U[0, j, i])  # hu*u+g*h*h/2
+            F[2, j, i] = Q[1, j, i] * U[2, j, i]  # hu * v
 
 
 cdef void get_discontinuous_flux_y(
@@ -45,20 +37,12 @@ cdef void get_discontinuous_flux_y(
     cdef Py_ssize_t k, j, i
     cdef cython.floating grav2 = gravity / 2.0
 
-    # F[0] = hv
-    for j in range(ny):
-        for i in range(nx):
-            F[0, j, i] = Q[2, j, i]
-
-    # F[1] = u * hv
-    for j in range(ny):
-        for i in range(nx):
-            F[1, j, i] = U[1, j, i] * Q[2, j, i]
-
-    # F[2] = hv * v + g/2 * h * h
+    # one sweep for all components so that each face's values are loaded only once
     for j in range(ny):
         for i in range(nx):
-            F[2, j, i] = Q[2, j, i] * U[2, j, i] + grav2 * U[0, j, i] * U[0, j, i]
+            F[0, j, i] = Q[2, j, i]  # hv
+            F[1, j, i] = U[1, j, i] * Q[2, j, i]  # u * hv
+            F[2, j, i] = Q[2, j, i] * U[2, j, i] + grav2 * U[0, j, i] * U[0, j, i]  # hv*v + g*h*h/2
 
 
 def get_discontinuous_flux(object states, double gravity):
@@ -131,25 +115,28 @@ cdef void central_scheme_kernel(
     cdef Py_ssize_t nx = Qm.shape[2]
     cdef Py_ssize_t ny = Qm.shape[1]
     cdef Py_ssize_t k, j, i
+    cdef cython.floating ap, am
     cdef cython.floating denominator
     cdef cython.floating coeff
 
-    for k in range(3):
-        for j in range(ny):
-            for i in range(nx):
-                denominator = Ap[j, i] - Am[j, i]
+    # components in the innermost loop so that local speeds are loaded only once per face
+    for j in range(ny):
+        for i in range(nx):
+            ap = Ap[j, i]
+            am = Am[j, i]
+            denominator = ap - am
 
-                # NOTE ============================================================================
-                # If `demoninator` is zero, then both `Ap` and `Am` should also be zero.
-                # =================================================================================
-                if denominator == 0.0:
-                    continue  # implying H[k, j, i] is simply 0
+            # NOTE ================================================================================
+            # If `demoninator` is zero, then both `Ap` and `Am` should also be zero.
+            # =====================================================================================
+            if denominator == 0.0:
+                continue  # implying H[:, j, i] is simply 0
 
-                coeff = Ap[j, i] * Am[j, i]
+            coeff = ap * am
 
+            for k in range(3):
                 H[k, j, i] = (
-                    Ap[j, i] * Fm[k, j, i] - Am[j, i] * Fp[k, j, i] +
-                    coeff * (Qp[k, j, i] - Qm[k, j, i])
+                    ap * Fm[k, j, i] - am * Fp[k, j, i] + coeff * (Qp[k, j, i] - Qm[k, j, i])
                 ) / denominator
 
 
@@ -262,3 +249,113 @@ def get_local_speed(object states, double gravity):
         raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
 
     return states
+
+
+cdef cython.floating max_local_speed_kernel(
+    const cython.floating[:, ::1] ap,
+    const cython.floating[:, ::1] am
+) nogil except *:
+    """Kernel of getting max(max(ap), max(-am)) in a single pass without temporary arrays.
+
+    A NaN in either array is returned immediately, so a diverged solution does not go unnoticed.
+    """
+    cdef Py_ssize_t ny = ap.shape[0]
+    cdef Py_ssize_t nx = ap.shape[1]
+    cdef Py_ssize_t i, j
+    cdef cython.floating ans = 0.0  # ap >= 0 and am <= 0, so zero is a valid initial value
+    cdef cython.floating p, m
+
+    for j in range(ny):
+        for i in range(nx):
+            p = ap[j, i]
+            m = -am[j, i]
+            if p != p or m != m:  # NaN; comparisons below would silently drop it
+                return p + m
+            ans = max(ans, max(p, m))
+
+    return ans
+
+
+def get_max_local_speed(object states):
+    """Get the maximum magnitudes of local speeds on faces normal to x and y directions.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+
+    Returns
+    -------
+    amax, bmax : scalars of the same dtype as the arrays in `states`
+        The maximum local speeds on faces normal to x and y directions, respectively.
+    """
+    x = states.face.x
+    y = states.face.y
+
+    dtype = x.plus.a.dtype
+
+    if dtype == numpy.single:
+        amax = max_local_speed_kernel[cython.float](x.plus.a, x.minus.a)
+        bmax = max_local_speed_kernel[cython.float](y.plus.a, y.minus.a)
+    elif dtype == numpy.double:
+        amax = max_local_speed_kernel[cython.double](x.plus.a, x.minus.a)
+        bmax = max_local_speed_kernel[cython.double](y.plus.a, y.minus.a)
+    else:
+        raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
+
+    # numpy scalars so that dividing by a zero speed gives `inf` rather than raising an exception
+    return dtype.type(amax), dtype.type(bmax)
+
+
+cdef void flux_divergence_kernel(
+    cython.floating[:, :, ::1] S,
+    const cython.floating[:, :, ::1] Hx,
+    const cython.floating[:, :, ::1] Hy,
+    const double inv_dx,
+    const double inv_dy
+) nogil except *:
+    """Kernel calculating the RHS contributed by the divergence of the numerical fluxes.
+
+    Each face flux is read once and all three components are written in a single pass. Cell sizes
+    are passed in as reciprocals so that the inner loop only multiplies.
+    """
+    cdef Py_ssize_t ny = S.shape[1]
+    cdef Py_ssize_t nx = S.shape[2]
+    cdef Py_ssize_t k, j, i
+
+    for k in range(3):
+        for j in range(ny):
+            for i in range(nx):
+                S[k, j, i] = (
+                    (Hx[k, j, i] - Hx[k, j, i+1]) * inv_dx + (Hy[k, j, i] - Hy[k, j+1, i]) * inv_dy
+                )
+
+
+def get_flux_divergence(object states):
+    """Calculate the right-hand-side terms contributed by the divergence of numerical fluxes.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. `states.s` is overwritten in-place. Returning it just for
+        coding style.
+    """
+    cdef object S = states.s
+    cdef object xH = states.face.x.cf
+    cdef object yH = states.face.y.cf
+    cdef double inv_dy = 1.0 / states.domain.delta[0]
+    cdef double inv_dx = 1.0 / states.domain.delta[1]
+
+    dtype = S.dtype
+
+    if dtype == numpy.single:
+        flux_divergence_kernel[cython.float](S, xH, yH, inv_dx, inv_dy)
+    elif dtype == numpy.double:
+        flux_divergence_kernel[cython.double](S, xH, yH, inv_dx, inv_dy)
+    else:
+        raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
+
+    return states
@@ -8,3 +8,4 @@ cimport cython
 
 include "cython_flux.pyx"
 include "cython_reconstruction.pyx"
+include "cython_source.pyx"
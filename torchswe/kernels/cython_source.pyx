@@ -0,0 +1,52 @@
+# vim:fenc=utf-8
+# vim:ft=pyrex
+
+
+cdef void topography_gradient_kernel(
+    cython.floating[:, :, ::1] S,
+    const cython.floating[:, :] H,
+    const cython.floating[:, :, ::1] grad,
+    const cython.floating gravity
+) nogil except *:
+    """Kernel subtracting topographic forces from the momentum components of the RHS (in-place).
+    """
+    cdef Py_ssize_t ny = S.shape[1]
+    cdef Py_ssize_t nx = S.shape[2]
+    cdef Py_ssize_t j, i
+    cdef cython.floating gh
+
+    for j in range(ny):
+        for i in range(nx):
+            gh = gravity * H[j, i]
+            S[1, j, i] -= gh * grad[0, j, i]
+            S[2, j, i] -= gh * grad[1, j, i]
+
+
+def add_topography_gradient(object states, object topo, double gravity):
+    """Add topographic forces to `states.s[1]` and `states.s[2]` in-place.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+    topo : torchswe.utils.data.Topography
+    gravity : float
+        Gravity in m / s^2.
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. Changed inplace. Returning it just for coding style.
+    """
+    cdef object S = states.s
+    cdef object H = states.p[(0,)+states.domain.nonhalo_c]
+
+    dtype = S.dtype
+
+    if dtype == numpy.single:
+        topography_gradient_kernel[cython.float](S, H, topo.grad, gravity)
+    elif dtype == numpy.double:
+        topography_gradient_kernel[cython.double](S, H, topo.grad, gravity)
+    else:
+        raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
+
+    return states
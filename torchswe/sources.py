@@ -18,6 +18,7 @@ if _TYPE_CHECKING:  # if we are having type checking, then we import correspondi
 # pylint: disable=wrong-import-position, ungrouped-imports
 import logging as _logging
 from torchswe import nplike as _nplike
+from torchswe.kernels import add_topography_gradient as _add_topography_gradient
 
 
 _logger = _logging.getLogger("torchswe.sources")
@@ -40,11 +41,8 @@ def topography_gradient(states: States, runtime: DummyDict, config: Config) -> S
     states : torchswe.utils.data.States
         The same object as the input. Changes are done in-place. Returning it just for coding style.
     """
-    # auto-broadcasting; add to rhs in-place
-    states.s[1:, ...] -= (
-        config.params.gravity * states.p[(0,)+states.domain.nonhalo_c] * runtime.topo.grad
-    )
-    return states
+    # a single fused pass without temporary arrays; add to rhs in-place
+    return _add_topography_gradient(states, runtime.topo, config.params.gravity)
 
 
 def point_mass_source(states: States, runtime: DummyDict, *args, **kwargs) -> States:
@@ -123,9 +121,10 @@ def friction(states: States, runtime: DummyDict, config: Config) -> States:
     states : torchswe.utils.data.States
         The same object as the input. Changes are done in-place. Returning it just for coding style.
     """
-    loc = _nplike.nonzero(states.p[(0,)+states.domain.nonhalo_c] > 0.)
+    # a boolean mask of wet cells; no need to materialize coordinate arrays through nonzero
+    loc = states.p[(0,)+states.domain.nonhalo_c] > 0.
 
-    # views
+    # gathered copies of wet cells
     h = states.p[(0,)+states.domain.nonhalo_c][loc]
     hu = states.q[(1,)+states.domain.nonhalo_c][loc]
     hv = states.q[(2,)+states.domain.nonhalo_c][loc]
@@ -133,7 +132,7 @@ def friction(states: States, runtime: DummyDict, config: Config) -> States:
 
     coef = runtime.friction.model(h, hu, hv, config.props.nu, roughness)
 
-    states.ss[1:, loc[0], loc[1]] += (
+    states.ss[1:, loc] += (
         - coef * _nplike.sqrt(_nplike.power(hu, 2)+_nplike.power(hv, 2)) /
         (8. * _nplike.power(h, 2))
     )
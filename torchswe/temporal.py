@@ -103,8 +103,9 @@ def euler(states: States, runtime: DummyDict, config: Config):
         _nplike.sync()
         runtime.dt = states.domain.comm.allreduce(runtime.dt, _MPI.MIN)
 
-        # update
-        states.q[internal] += (states.s * runtime.dt)
+        # update; scaling the rhs in-place avoids allocating a temporary array
+        states.s *= runtime.dt
+        states.q[internal] += states.s
         states = semi_implicit_step(states, internal, runtime.dt)
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
@@ -193,7 +194,8 @@ def ssprk2(states: States, runtime: DummyDict, config: Config):
         runtime.dt = states.domain.comm.allreduce(runtime.dt, _MPI.MIN)
 
         # update for the first step; now states.q is u1 = u_{n} + dt * RHS(u_{n})
-        states.q[internal] += (states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.q[internal] += states.s
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
         states = _exchange_states(states)
@@ -204,7 +206,9 @@ def ssprk2(states: States, runtime: DummyDict, config: Config):
         states, _ = _prepare_rhs(states, runtime, config)
 
         # calculate u_{n+1} = (u_{n} + u^1 + dt * RHS(u^1)) / 2.
-        states.q[internal] += (prev_q + states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.s += prev_q
+        states.q[internal] += states.s
         states.q /= 2  # doesn't matter whether ghost cells are also divided by 2
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
@@ -273,6 +277,9 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
     # to hold previous solution
     prev_q = _copy.deepcopy(states.q[internal])
 
+    # scratch space for 3 * u_{n}; allocated once and reused in every time step
+    buff = _nplike.zeros_like(prev_q)
+
     # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
     states = _exchange_states(states)
     states = runtime.gh_updater(states)
@@ -298,7 +305,8 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
         runtime.dt = states.domain.comm.allreduce(runtime.dt, _MPI.MIN)
 
         # update for the first step; now states.q is u1 = u_{n} + dt * RHS(u_{n})
-        states.q[internal] += (states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.q[internal] += states.s
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
         states = _exchange_states(states)
@@ -309,7 +317,9 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
         states, _ = _prepare_rhs(states, runtime, config)
 
         # now states.q = u^2 = (3 * u_{n} + u^1 + dt * RHS(u^1)) / 4
-        states.q[internal] += (prev_q * 3. + states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.s += _nplike.multiply(prev_q, 3., out=buff)
+        states.q[internal] += states.s
         states.q /= 4.
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
@@ -321,7 +331,8 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
         states, _ = _prepare_rhs(states, runtime, config)
 
         # now states.q = u_{n+1} = (u_{n} + 2 * u^2 + 2 * dt * RHS(u^1)) / 3
-        states.q[internal] += (states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.q[internal] += states.s
         states.q *= 2.
         states.q[internal] += prev_q
         states.q /= 3.
@@ -9,13 +9,14 @@
 """Objects holding simulation configuraions.
 """
 import pathlib as _pathlib
+from functools import lru_cache as _lru_cache
+from typing import Any as _Any
 from typing import Literal as _Literal
 from typing import Tuple as _Tuple
 from typing import Union as _Union
 from typing import Optional as _Optional
+import numpy as _numpy
 from yaml import load as _load
-from yaml import Loader as _Loader
-from yaml import add_constructor as _add_constructor
 from yaml import add_representer as _add_representer
 from pydantic import BaseModel as _BaseModel
 from pydantic import Field as _Field
@@ -24,22 +25,58 @@ from pydantic import root_validator as _root_validator
 from pydantic import conint as _conint
 from pydantic import confloat as _confloat
 from pydantic import validate_model as _validate_model
-
+from pydantic import create_model as _create_model
+from pydantic import ValidationError as _ValidationError
+from pydantic.error_wrappers import ErrorWrapper as _ErrorWrapper
+
+try:  # use libyaml's C parser when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# tags of BC types and output methods
+_PERIODIC = "periodic"
+_EXTRAP = "extrap"
+_CONST = "const"
+_INFLOW = "inflow"
+_OUTFLOW = "outflow"
+_AT = "at"
+_EVERY_SECONDS = "t_start every_seconds multiple"
+_EVERY_STEPS = "t_start every_steps multiple"
+_N_SAVES = "t_start t_end n_saves"
+_NO_SAVE = "t_start t_end no save"
+_N_STEPS_NO_SAVE = "t_start n_steps no save"
+
+# output methods controlled by numbers of steps and by end times, respectively
+_STEP_MODES = frozenset((_EVERY_STEPS, _N_STEPS_NO_SAVE))
+_T_END_MODES = frozenset((_N_SAVES, _NO_SAVE))
 
 # alias to type hints
-BCTypeHint = _Literal["periodic", "extrap", "const", "inflow", "outflow"]
-
-OutputTypeHint = _Union[
-    _Tuple[_Literal["at"], _Tuple[_confloat(ge=0), ...]],
-    _Tuple[
-        _Literal["t_start every_seconds multiple"],
-        _confloat(ge=0), _confloat(gt=0), _conint(ge=1)
-    ],
-    _Tuple[_Literal["t_start every_steps multiple"], _confloat(ge=0), _conint(ge=1), _conint(ge=1)],
-    _Tuple[_Literal["t_start t_end n_saves"], _confloat(ge=0), _confloat(gt=0), _conint(ge=1)],
-    _Tuple[_Literal["t_start t_end no save"], _confloat(ge=0), _confloat(gt=0)],
-    _Tuple[_Literal["t_start n_steps no save"], _confloat(ge=0), _conint(ge=1)],
-]
+BCTypeHint = _Literal[_PERIODIC, _EXTRAP, _CONST, _INFLOW, _OUTFLOW]
+
+_OUTPUT_TYPES = {
+    _AT: _Tuple[_Literal[_AT], _Tuple[_confloat(ge=0), ...]],
+    _EVERY_SECONDS: _Tuple[
+        _Literal[_EVERY_SECONDS], _confloat(ge=0), _confloat(gt=0), _conint(ge=1)],
+    _EVERY_STEPS: _Tuple[_Literal[_EVERY_STEPS], _confloat(ge=0), _conint(ge=1), _conint(ge=1)],
+    _N_SAVES: _Tuple[_Literal[_N_SAVES], _confloat(ge=0), _confloat(gt=0), _conint(ge=1)],
+    _NO_SAVE: _Tuple[_Literal[_NO_SAVE], _confloat(ge=0), _confloat(gt=0)],
+    _N_STEPS_NO_SAVE: _Tuple[_Literal[_N_STEPS_NO_SAVE], _confloat(ge=0), _conint(ge=1)],
+}
+
+OutputTypeHint = _Union[tuple(_OUTPUT_TYPES.values())]
+
+# one pydantic field per output method, so `TemporalConfig._val_output_type` validates a value only
+# against the member matching its tag instead of trying every member of OutputTypeHint in order
+_OUTPUT_FIELDS = {
+    tag: _create_model(f"OutputModel{i}", value=(hint, ...)).__fields__["value"]
+    for i, (tag, hint) in enumerate(_OUTPUT_TYPES.items())
+}
+
+# JSON schema of OutputTypeHint, as the field `TemporalConfig.output` itself is loosely typed
+_OUTPUT_SCHEMA = _create_model("OutputModel", value=(OutputTypeHint, ...)).schema()
+_OUTPUT_SCHEMA = _OUTPUT_SCHEMA["properties"]["value"]["anyOf"]
 
 TemporalTypeHint = _Literal["Euler", "SSP-RK2", "SSP-RK3"]
 
@@ -49,27 +86,103 @@ class BaseConfig(_BaseModel):
 
     class Config:  # pylint: disable=too-few-public-methods
         """pydantic configuration of this model."""
-        validate_all = True
         allow_population_by_field_name = True
-        arbitrary_types_allowed = True
+        copy_on_model_validation = False
         extra = "forbid"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # names of the fields holding nested configs; used by `check` to avoid scanning all fields
+        cls.__nested_config_fields__ = tuple(
+            name for name, field in cls.__fields__.items()
+            if isinstance(field.type_, type) and issubclass(field.type_, BaseConfig)
+        )
+
     def __getitem__(self, key):
-        return super().__getattribute__(key)
+        try:  # fields live in the instance's __dict__
+            return self.__dict__[key]
+        except KeyError:
+            return super().__getattribute__(key)
 
     def __setitem__(self, key, value):
         self.__setattr__(key, value)
 
-    def check(self):
-        """Manually trigger the validation of the data in this instance."""
-        _, _, validation_error = _validate_model(self.__class__, self.__dict__)
+    @classmethod
+    def from_trusted(cls, data):
+        """Create an instance from trusted, already-validated data without running validators.
+
+        Arguments
+        ---------
+        data : dict
+            A mapping like the output of `.dict()`. Keys can be field names or aliases. Nested
+            mappings of BaseConfig fields are reconstructed recursively.
+
+        Returns
+        -------
+        An instance of the class.
+
+        Notes
+        -----
+        No validation, including cross-field validation, is done. `data` must be the output of
+        `.dict()` of an instance of the same class that was validated in the same process. Never
+        pass data from files, users, or other untrusted sources; use the normal constructor
+        instead.
+        """
+        values = {}
+        for name, field in cls.__fields__.items():
+            if name in data:
+                val = data[name]
+            elif field.alias in data:
+                val = data[field.alias]
+            else:
+                continue
+
+            if isinstance(val, dict) and isinstance(field.type_, type) and \
+                    issubclass(field.type_, BaseConfig):
+                val = field.type_.from_trusted(val)
+
+            values[name] = val
+        return cls.construct(**values)
+
+    def check(self, full: bool = False):
+        """Manually trigger the validation of the data in this instance.
+
+        Arguments
+        ---------
+        full : bool
+            By default, only the root (i.e., cross-field) validators are re-run, as the fields were
+            already validated when the instance was created. Use `full=True` to re-validate every
+            field, e.g., after fields were modified or arrays were filled in-place.
+        """
+        cls = self.__class__
+
+        if full:
+            _, _, validation_error = _validate_model(cls, self.__dict__)
+        else:
+            validation_error = self._check_root()
 
         if validation_error:
             raise validation_error
 
-        for field in self.__dict__.values():
-            if isinstance(field, BaseConfig):
-                field.check()
+        for name in cls.__nested_config_fields__:
+            field = getattr(self, name)
+            if field is not None:  # optional configs
+                field.check(full)
+
+    def _check_root(self):
+        """Run only the root validators on a copy of this instance's data."""
+        cls = self.__class__
+        values = dict(self.__dict__)
+
+        try:
+            for validator in cls.__pre_root_validators__:
+                values = validator(cls, values)
+            for _, validator in cls.__post_root_validators__:
+                values = validator(cls, values)
+        except (ValueError, TypeError, AssertionError) as err:
+            return _ValidationError([_ErrorWrapper(err, loc="__root__")], cls)
+
+        return None
 
 
 class SpatialConfig(BaseConfig):
@@ -127,29 +240,42 @@ class TemporalConfig(BaseConfig):
 
     dt: _confloat(gt=0.) = 1e-3
     adaptive: bool = True
-    output: OutputTypeHint
+    output: _Any = _Field(..., anyOf=_OUTPUT_SCHEMA)  # OutputTypeHint; see `_val_output_type`
     max_iters: _conint(gt=0) = _Field(1000000, alias="max iterations")
     scheme: TemporalTypeHint = "SSP-RK2"
 
+    @_validator("output", pre=True)
+    def _val_output_type(cls, v):
+        """Validate the output method against the member of OutputTypeHint matching its tag."""
+        try:
+            field = _OUTPUT_FIELDS[v[0]]
+        except (KeyError, IndexError, TypeError) as err:
+            raise ValueError(f"Unrecognized output method: {v}") from err
+
+        v, errors = field.validate(v, {}, loc=(), cls=cls)
+        if errors:
+            raise _ValidationError(errors if isinstance(errors, list) else [errors], cls)
+        return v
+
     @_validator("output")
     def _val_output_method(cls, v, values):
         """Validate that end time > start time."""
 
-        if v[0] == "at":
+        if v[0] == _AT:
             msg = "Times are not monotonically increasing"
             assert all(v[1][i] > v[1][i-1] for i in range(1, len(v[1]))), msg
-        elif v[0] in ["t_start every_steps multiple", "t_start n_steps no save"]:
+        elif v[0] in _STEP_MODES:
             assert not values["adaptive"], "Needs \"adaptive=False\"."
-        elif v[0] in ["t_start t_end n_saves", "t_start t_end no save"]:
+        elif v[0] in _T_END_MODES:
             assert v[2] > v[1], "End time is not greater than start time."
 
         return v
 
-    @_validator("max_iters")
+    @_validator("max_iters", always=True)
     def _val_max_iters(cls, v, values):
         """Validate and modify max_iters."""
         try:
-            if values["output"][0] in ["t_start every_steps multiple", "t_start n_steps no save"]:
+            if values["output"][0] in _STEP_MODES:
                 v = values["output"][2]  # use per_step as max_iters
         except KeyError as err:
             raise AssertionError("Fix `output` first") from err
@@ -168,21 +294,21 @@ class SingleBCConfig(BaseConfig):
     values : a length-3 tuple of floats or None
         Some BC types require user-provided values (e.g., "const"). Use this to give values.
         Usually, they are the conservative quantities, i.e., w, hu, and hv. For "inflow", however,
-        they are non-conservative quantities, i.e., u and v. Defautl: [None, None, None]
+        they are non-conservative quantities, i.e., u and v. Defautl: (None, None, None)
     """
     # pylint: disable=too-few-public-methods, no-self-argument, invalid-name, no-self-use
 
     types: _Tuple[BCTypeHint, BCTypeHint, BCTypeHint]
-    values: _Tuple[_Optional[float], _Optional[float], _Optional[float]] = [None, None, None]
+    values: _Tuple[_Optional[float], _Optional[float], _Optional[float]] = (None, None, None)
 
     @_validator("types")
     def check_periodicity(cls, v):
         """If one component is periodic, all components should be periodic."""
-        if any(t == "periodic" for t in v):
-            assert all(t == "periodic" for t in v), "All components should be periodic."
+        if any(t == _PERIODIC for t in v):
+            assert all(t == _PERIODIC for t in v), "All components should be periodic."
         return v
 
-    @_validator("values")
+    @_validator("values", always=True)
     def check_values(cls, v, values):
         """Check if values are set accordingly for some BC types.
         """
@@ -190,9 +316,9 @@ class SingleBCConfig(BaseConfig):
             return v
 
         for bctype, bcval in zip(values["types"], v):
-            if bctype in ("const", "inflow"):
+            if bctype in (_CONST, _INFLOW):
                 assert isinstance(bcval, float), \
-                    f"Using BC type \"{bctype.value}\" requires setting a value."
+                    f"Using BC type \"{bctype}\" requires setting a value."
         return v
 
 
@@ -217,15 +343,11 @@ class BCConfig(BaseConfig):
         if any((t not in values) for t in ["west", "east", "south", "north"]):
             return values
 
-        result = True
-        for types in zip(values["west"]["types"], values["east"]["types"]):
-            if any(t == "periodic" for t in types):
-                result = all(t == "periodic" for t in types)
-        for types in zip(values["north"]["types"], values["south"]["types"]):
-            if any(t == "periodic" for t in types):
-                result = all(t == "periodic" for t in types)
-        if not result:
-            raise ValueError("Periodic BCs do not match at boundaries and components.")
+        # SingleBCConfig guarantees a boundary is either fully periodic or not periodic at all
+        for bc1, bc2 in (("west", "east"), ("north", "south")):
+            types1, types2 = values[bc1]["types"], values[bc2]["types"]
+            if _PERIODIC in (types1[0], types2[0]) and types1 != types2:
+                raise ValueError("Periodic BCs do not match at boundaries and components.")
         return values
 
 
@@ -308,8 +430,10 @@ class PointSourceConfig(BaseConfig):
     @_validator("times")
     def val_times(cls, val):
         """Validate the tuple of times."""
-        for i in range(1, len(val)):
-            assert val[i] - val[i-1] > 0., f"{val[i]} is not greater than {val[i-1]}"
+        diffs = _numpy.diff(_numpy.asarray(val, dtype=_numpy.float64))
+        if not (diffs > 0.).all():  # written this way so that NaN also fails
+            i = int(_numpy.flatnonzero(~(diffs > 0.))[0]) + 1
+            raise AssertionError(f"{val[i]} is not greater than {val[i-1]}")
         return val
 
     @_validator("rates")
@@ -338,24 +462,32 @@ class ParamConfig(BaseConfig):
     drytol : float
         Dry tolerance in meters. Default: 1.0e-4.
     ngh : int
-        Number of ghost cell layers per boundary. At least 2 required.
+        Number of ghost cell layers per boundary. Currently, only 2 is supported.
     dtype : str
-        The floating number type. Either "float32" or "float64". Default: "float64"
+        The floating number type. Either "float32" or "float64". Default: "float32"
     """
     # pylint: disable=too-few-public-methods, no-self-argument, invalid-name, no-self-use
 
     gravity: _confloat(ge=0.) = 9.81
     theta: _confloat(ge=1., le=2.) = 1.3
     drytol: _confloat(ge=0.) = _Field(1.0e-4, alias="dry tolerance")
-    ngh: _conint(ge=2) = 2
+    ngh: _Literal[2] = 2  # currently, the solver only supports ngh = 2
     log_steps: _conint(ge=1) = _Field(100, alias="print steps")
-    dtype: _Literal["float32", "float64"] = "float64"
+    dtype: _Literal["float32", "float64"] = "float32"
+
+
+# exponents of the Lewis-Squires correlation
+_LS_EXP = -0.2661
+_LS_INV_EXP = -1. / 0.2661
 
-    @_validator("ngh")
-    def _val_ngh(cls, val):
-        """Currently only support ngh=2"""
-        assert val == 2, "Currently, the solver only supports ngh = 2"
-        return val
+
+@_lru_cache(maxsize=64)
+def _compute_nu(ref_mu: float, amb_temp: float, ref_temp: float, rho: float):
+    """Kinematic viscosity (m^2 / s) at `amb_temp` from the Lewis-Squires correlation."""
+    # dynamic viscosity at ambient temperature (unit: cP)
+    val = ref_mu**_LS_EXP + (amb_temp - ref_temp) / 233.
+    val = val**_LS_INV_EXP * 1e-3  # convert to kg / s / m
+    return val / rho
 
 
 class FluidPropsConfig(BaseConfig):
@@ -382,18 +514,15 @@ class FluidPropsConfig(BaseConfig):
     amb_temp: _confloat(strict=True, gt=-273.15) = _Field(..., alias="ambient temperature")
     nu : _Optional[_confloat(strict=True, gt=0.)] = _Field(None)
 
-    @_validator("nu")
+    @_validator("nu", always=True)
     def val_nu(cls, val, values):
         """Validate nu."""
         if val is None:
-            # get dynamic viscosity at ambient temperature (unit: cP) (Lewis-Squires correlation)
-            val = values["ref_mu"]**(-0.2661) + (values["amb_temp"] - values["ref_temp"]) / 233.
-            val = val**(-1./0.2661) * 1e-3 # convert to kg / s / m
-
             try:
-                val /= values["rho"]  # kinematic viscosity (m^2 / s)
+                val = _compute_nu(
+                    values["ref_mu"], values["amb_temp"], values["ref_temp"], values["rho"])
             except KeyError as err:
-                raise AssertionError("Correct `density` (or `rho`) first.") from err
+                raise AssertionError("Please fix other fields first.") from err
         return val
 
 
@@ -422,7 +551,7 @@ class FrictionConfig(BaseConfig):
     value: _Optional[_confloat(strict=True, ge=0.)] = _Field(None, alias="roughness")
     model: _Literal["bellos_et_al_2018"] = _Field("bellos_et_al_2018", alias="coefficient model")
 
-    @_validator("value")
+    @_validator("value", always=True)
     def val_value(cls, val, values):
         """Validate FrictionConfig.value"""
         try:
@@ -477,11 +606,11 @@ class Config(BaseConfig):
     ptsource: _Optional[PointSourceConfig] = _Field(None, alias="point source")
     friction: _Optional[FrictionConfig] = _Field(None, alias="friction")
     props: _Optional[FluidPropsConfig] = _Field(None, alias="fluid properties")
-    params: ParamConfig = _Field(ParamConfig(), alias="parameters")
+    params: ParamConfig = _Field(default_factory=ParamConfig, alias="parameters")
     prehook: _Optional[_pathlib.Path]
     case: _Optional[_pathlib.Path]
 
-    @_validator("props")
+    @_validator("props", always=True)
     def val_props(cls, val, values):
         """Validate props."""
         try:
@@ -494,22 +623,51 @@ class Config(BaseConfig):
         return val
 
 
-# register the Config class in yaml with tag !Config
-_add_constructor(
+class _ConfigLoader(_SafeLoader):  # pylint: disable=too-many-ancestors
+    """A YAML loader recognizing the tag !Config; other loaders are left untouched."""
+
+
+# register the Config class with tag !Config
+_ConfigLoader.add_constructor(
     "!Config",
     lambda loader, node: Config(**loader.construct_mapping(node, deep=True))
 )
 
+
+def _to_builtins(obj):
+    """Convert tuples and paths in a nested dict from `.dict()` to YAML-safe lists and strings."""
+    if isinstance(obj, dict):
+        return {key: _to_builtins(val) for key, val in obj.items()}
+    if isinstance(obj, (tuple, list)):
+        return [_to_builtins(val) for val in obj]
+    if isinstance(obj, _pathlib.PurePath):
+        return str(obj)
+    return obj
+
+
 _add_representer(
     Config,
     lambda dumper, data: dumper.represent_mapping(
-        tag="!Config", mapping=_load(
-            data.json(by_alias=True), Loader=_Loader),
-        flow_style=True
+        tag="!Config", mapping=_to_builtins(data.dict(by_alias=True)), flow_style=True
     )
 )
 
 
+@_lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int):  # pylint: disable=unused-argument
+    """Parse and validate a YAML config file; `mtime_ns` is only a part of the cache key."""
+
+    # binary mode: the YAML reader detects the encoding and decodes the bytes itself
+    with open(path, "rb") as fobj:
+        config = _load(fobj, _ConfigLoader)
+
+    assert isinstance(config, Config), \
+        f"Failed to parse {path} as a Config object. " + \
+        "Check if `--- !Config` appears in the header of the YAML"
+
+    return config
+
+
 def get_config(case: str):
     """Get configuration from a case folder.
 
@@ -521,15 +679,13 @@ def get_config(case: str):
     Returns
     -------
     torchswe.utils.config.Config
-    """
 
-    case = _pathlib.Path(case).expanduser().resolve()
-
-    with open(case.joinpath("config.yaml"), "r", encoding="utf-8") as fobj:
-        config = _load(fobj, _Loader)
-
-    assert isinstance(config, Config), \
-        f"Failed to parse {case.joinpath('config.yaml')} as a Config object. " + \
-        "Check if `--- !Config` appears in the header of the YAML"
+    Notes
+    -----
+    Parsed configurations are cached per file path and modification time. The returned object is
+    always a deep copy, so modifying it does not affect later calls.
+    """
 
-    return config
+    path = _pathlib.Path(case).expanduser().resolve().joinpath("config.yaml")
+    config = _load_config_cached(str(path), path.stat().st_mtime_ns)
+    return config.copy(deep=True)
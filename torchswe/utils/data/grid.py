@@ -24,6 +24,7 @@ from typing import Union as _Union
 from mpi4py import MPI as _MPI
 from mpi4py.util.dtlib import from_numpy_dtype as _from_numpy_dtype
 from pydantic import validator as _validator
+from pydantic import PrivateAttr as _PrivateAttr
 from pydantic import conint as _conint
 from pydantic import confloat as _confloat
 from pydantic import root_validator as _root_validator
@@ -71,6 +72,10 @@ class Gridline(_BaseConfig):
     The lengths of xfcenters and yfcenters depend on the direction.
     """
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
+
     dtype: _DummyDtype
     axis: _Literal["x", "y"]  # noqa: F821
     gn: _conint(strict=True, gt=0)
@@ -149,6 +154,7 @@ class Timeline(_BaseConfig):
     """
     values: _Tuple[_confloat(ge=0.), ...]
     save: bool
+    _lookup: dict = _PrivateAttr(None)  # maps time values to their indices; built by `index`
 
     @_validator("values")
     def _val_values(cls, val):  # pylint: disable=no-self-argument, no-self-use
@@ -157,6 +163,16 @@ class Timeline(_BaseConfig):
         assert all(pos), "Times are not in a monotonically increasing order."
         return val
 
+    def index(self, value):
+        """Get the index of a time value in O(1); raise a ValueError if it is not found."""
+        if self._lookup is None:  # also covers instances created without __init__, e.g., construct
+            self._lookup = {val: i for i, val in enumerate(self.values)}
+
+        try:
+            return self._lookup[value]
+        except KeyError as err:
+            raise ValueError(f"Time {value} was not found among {self.values}") from err
+
     def __getitem__(self, key):
         return self.values.__getitem__(key)
 
@@ -179,6 +195,10 @@ class Domain(_BaseConfig):
         x and y grindline coordinates.
     """
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
+
     # mpi communicator
     comm: _MPI.Cartcomm
 
@@ -79,6 +79,10 @@ class FrictionModel(_BaseConfig):
     """An object holding required data/info for friction.
     """
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
+
     domain: _Domain
     roughness: _nplike.ndarray
     model: _Callable  # pydantic does not check the signature, so useless to specify signature
@@ -190,9 +194,10 @@ def get_frictionmodel(config: Config, domain: Domain = None, comm: MPI.Comm = No
     # set the model
     data.model = _friction_model_selector(fcfg.model)
 
-    # set roughness if a constant value is provided
+    # set roughness if a constant value is provided; a read-only broadcast view of one element
     if fcfg.value is not None:
-        data.roughness = _nplike.full(data.domain.shape, fcfg.value, dtype=domain.dtype)
+        data.roughness = _nplike.broadcast_to(
+            _nplike.array([fcfg.value], dtype=domain.dtype), data.domain.shape)
         return FrictionModel(**data)
 
     # otherwise, get roughness from a file
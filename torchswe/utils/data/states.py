@@ -80,6 +80,10 @@ class FaceOneSideModel(_BaseConfig):
         An array holding discontinuous fluxes.
     """
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
+
     q: _nplike.ndarray
     p: _nplike.ndarray
     a: _nplike.ndarray
@@ -119,6 +123,10 @@ class FaceTwoSideModel(_BaseConfig):
         An object holding common flux (i.e., continuous or numerical flux)
     """
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
+
     plus: FaceOneSideModel
     minus: FaceOneSideModel
     cf: _nplike.ndarray
@@ -181,6 +189,10 @@ class HaloRingOSC(_BaseConfig):
     sr, nr, wr, er : mpi4py.MPI.datatype
     """
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
+
     # one-sided communication window
     win: _MPI.Win
 
@@ -290,6 +302,10 @@ class States(_BaseConfig):
         An object holding MPI datatypes for one-sided communications of halo rings.
     """
 
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
+
     # associated domain
     domain: _Domain
 
@@ -558,7 +574,7 @@ def get_initial_states(config: Config, domain: Domain = None, comm: MPI.Comm = N
     # special case: constant I.C.
     if config.ic.values is not None:
         states.q[(slice(None),)+domain.nonhalo_c] = _nplike.array(config.ic.values).reshape(3, 1, 1)
-        states.check()
+        states.check(full=True)
         return states
 
     # otherwise, read data from a NetCDF file
@@ -573,13 +589,13 @@ def get_initial_states(config: Config, domain: Domain = None, comm: MPI.Comm = N
     # unfortunately, we need to do interpolation in such a situation
     if interp:
         _logger.warning("Grids do not match. Doing spline interpolation.")
-        for i in range(3):
-            states.q[(i,)+domain.nonhalo_c] = _nplike.array(
-                _interpolate(data.x, data.y, data[config.ic.keys[i]].T, domain.x.c, domain.y.c).T
-            )
+        stacked = _nplike.stack([data[key].T for key in config.ic.keys])  # (3, nx, ny)
+        states.q[(slice(None),)+domain.nonhalo_c] = _nplike.array(
+            _interpolate(data.x, data.y, stacked, domain.x.c, domain.y.c).transpose(0, 2, 1)
+        )
     else:
         for i in range(3):
             states.q[(i,)+domain.nonhalo_c] = data[config.ic.keys[i]]
 
-    states.check()
+    states.check(full=True)
     return states
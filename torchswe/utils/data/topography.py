@@ -52,6 +52,10 @@ class Topography(_BaseConfig):
     grad : (2, ny, nx) array
         Derivatives w.r.t. x and y at cell centers.
     """
+
+    class Config:  # pylint: disable=too-few-public-methods
+        """pydantic configuration of this model."""
+        arbitrary_types_allowed = True
     # pylint: disable=invalid-name
 
     # associated domain
@@ -375,12 +375,12 @@ def read_snapshot(states: States, runtime: DummyDict, config: Config):
         states.p[(0,)+domain.nonhalo_c] = _nplike.asarray(snapshot["states/h"][domain.global_c])
         states.p[(1,)+domain.nonhalo_c] = _nplike.asarray(snapshot["states/u"][domain.global_c])
         states.p[(2,)+domain.nonhalo_c] = _nplike.asarray(snapshot["states/v"][domain.global_c])
-        states.check()
+        states.check(full=True)
 
         if config.ptsource is not None:
             runtime.ptsource.irate = snapshot["ptsource/irate"][()]
             runtime.ptsource.active = snapshot["ptsource/active"][()]
-            runtime.ptsource.check()
+            runtime.ptsource.check(full=True)
 
         runtime.counter = int(snapshot.attrs["iterations"])
 
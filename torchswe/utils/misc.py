@@ -11,7 +11,7 @@
 import logging as _logging
 import collections as _collections
 
-from scipy.interpolate import RectBivariateSpline as _RectBivariateSpline
+import numpy as _numpy
 from mpi4py import MPI as _MPI
 from torchswe import nplike as _nplike
 
@@ -70,6 +70,18 @@ class DummyDtype:  # pylint: disable=too-few-public-methods
         return v
 
 
+def _to_numpy(arr):
+    """Convert an array from any np-like backend to a vanilla numpy.ndarray."""
+    try:
+        return _numpy.asarray(arr)
+    except TypeError as err:
+        if str(err).startswith("Implicit conversion to a NumPy array is not allowe"):
+            return arr.get()  # cupy
+        if str(err).startswith("can't convert cuda:"):
+            return arr.cpu().numpy()  # pytorch
+        raise
+
+
 def interpolate(x_in, y_in, data_in, x_out, y_out):
     """A wrapper to interpolation with scipy.interpolate.RectBivariateSpline.
 
@@ -77,37 +89,38 @@ def interpolate(x_in, y_in, data_in, x_out, y_out):
     backends use different method to convert to vanilla numpy.ndarray. This function unifies them
     and the interpolation.
 
+    `data_in` may also have a leading axis stacking several variables defined on the same grid. In
+    this case, the gridlines are converted only once, and all variables are returned in one array.
+
     The return is always vanilla numpy.ndarray.
 
     Arguments
     ---------
     x_in, y_in, data_in : nplike.ndarray
-        The first three inputs to scipy.interpolate.RectBivariateSpline.
+        The first three inputs to scipy.interpolate.RectBivariateSpline. `data_in` has a shape of
+        either (x_in.size, y_in.size) or (nvars, x_in.size, y_in.size).
     x_out, y_out : nplike.ndarray
         The first two inputs to scipy.interpolate.RectBivariateSpline.__call__.
 
     Returns
     -------
     data_out : numpy.ndarray
-        The output of scipy.interpolate.RectBivariateSpline.__call__.
+        The output of scipy.interpolate.RectBivariateSpline.__call__. If `data_in` is 3D, the
+        outputs of all variables are stacked along the first axis.
     """
 
-    try:
-        func = _RectBivariateSpline(x_in, y_in, data_in, kx=1, ky=1)
-    except TypeError as err:
-        if str(err).startswith("Implicit conversion to a NumPy array is not allowe"):
-            func = _RectBivariateSpline(x_in.get(), y_in.get(), data_in.get())  # cupy
-            x_out = x_out.get()
-            y_out = y_out.get()
-        elif str(err).startswith("can't convert cuda:"):
-            func = _RectBivariateSpline(
-                x_in.cpu().numpy(), y_in.cpu().numpy(), data_in.cpu().numpy())  # pytorch
-            x_out = x_out.cpu().numpy()
-            y_out = y_out.cpu().numpy()
-        else:
-            raise
-
-    return func(x_out, y_out)
+    # scipy.interpolate is slow to import and only needed when grids mismatch, so import it lazily
+    # pylint: disable=import-outside-toplevel
+    from scipy.interpolate import RectBivariateSpline as _RectBivariateSpline
+
+    x_in, y_in, x_out, y_out = (_to_numpy(arr) for arr in (x_in, y_in, x_out, y_out))
+    data_in = _to_numpy(data_in)
+
+    if data_in.ndim == 2:
+        return _RectBivariateSpline(x_in, y_in, data_in, kx=1, ky=1)(x_out, y_out)
+
+    return _numpy.stack(
+        [_RectBivariateSpline(x_in, y_in, data, kx=1, ky=1)(x_out, y_out) for data in data_in])
 
 
 def cal_num_procs(world_size: int, gnx: int, gny: int):